@@ -15,6 +15,7 @@ public class GuiDialogCraftingDesigner : GuiDialogBlockEntity
 	private const int GridRows = 3;
 	private const int OutputSlotId = 9;
 	private const int PacketIdReset = 1002;
+	private const string Symbols = "ABCDEFGHI"; // One per grid slot at most
 
 	private readonly int[] ToolDurabilityCosts = new int[GridCols * GridRows];
 	private readonly record struct IngredientInfo(string Type, string Code, int Quantity, bool IsTool, int ToolCost);
@@ -158,16 +159,18 @@ public class GuiDialogCraftingDesigner : GuiDialogBlockEntity
 	{
 		if (Inventory[OutputSlotId].Empty) return null;
 
-		// Gather non-empty input slots
-		List<int> used = new();
-		for (int i = 0; i < GridCols * GridRows; i++) { if (!Inventory[i].Empty) used.Add(i); }
-		if (used.Count == 0) return null;
-		used.Sort(); // deterministic letter assignment
+		char[] symBySlot = new char[GridCols * GridRows]; // Flat, indexed like the slots; '_' marks empty
+		Array.Fill(symBySlot, '_');
+		Dictionary<IngredientInfo, char> symByIngredient = new();
+		List<IngredientInfo> ingBySymbol = new(); // Symbols are handed out in order, so index i is Symbols[i]
+		int symIndex = 0;
 
-		// Determine minimal bounding rect of used slots
+		// Assign symbols in slot order and find the minimal bounding rect of used slots
 		int minX = 999, minY = 999, maxX = -1, maxY = -1;
-		foreach (int idx in used)
+		for (int idx = 0; idx < GridCols * GridRows; idx++)
 		{
+			if (Inventory[idx].Empty) continue;
+
 			int x = idx % GridCols;
 			int y = idx / GridCols;
 
@@ -175,19 +178,7 @@ public class GuiDialogCraftingDesigner : GuiDialogBlockEntity
 			if (y < minY) minY = y;
 			if (x > maxX) maxX = x;
 			if (y > maxY) maxY = y;
-		}
-		int width = maxX - minX + 1;
-		int height = maxY - minY + 1;
-
-		// Symbols A to I
-		char[] symbols = "ABCDEFGHI".ToCharArray();
-		Dictionary<int, char> symBySlot = new();
-		Dictionary<string, char> symByIngredientKey = new();
-		SortedDictionary<char, IngredientInfo> ingBySymbol = new();
-		int symIndex = 0;
 
-		foreach (int idx in used)
-		{
 			ItemStack stack = Inventory[idx].Itemstack;
 			(string ingType, string ingCode) = GetTypeAndCode(stack);
 			int qty = stack.StackSize;
@@ -196,51 +187,54 @@ public class GuiDialogCraftingDesigner : GuiDialogBlockEntity
 			bool isTool = toolCost >= 0 && ingType == "item";
 			int toolCostKey = isTool ? toolCost : -1;
 
-			string key = $"{ingType}|{ingCode}|{qty}|{(isTool ? 1 : 0)}|{toolCostKey}";
-			if (!symByIngredientKey.TryGetValue(key, out char sym))
+			IngredientInfo ing = new(ingType, ingCode, qty, isTool, toolCostKey);
+			if (!symByIngredient.TryGetValue(ing, out char sym))
 			{
-				if (symIndex >= symbols.Length) { return null; }
-				sym = symbols[symIndex++];
-				symByIngredientKey[key] = sym;
-				ingBySymbol[sym] = new IngredientInfo(ingType, ingCode, qty, isTool, toolCostKey);
+				if (symIndex >= Symbols.Length) { return null; }
+				sym = Symbols[symIndex++];
+				symByIngredient[ing] = sym;
+				ingBySymbol.Add(ing);
 			}
 
 			symBySlot[idx] = sym;
 		}
+		if (maxX < 0) return null; // No used input slots
+
+		int width = maxX - minX + 1;
+		int height = maxY - minY + 1;
 
-		// Build ingredientPattern rows
-		string[] rows = new string[height];
+		// Output
+		ItemStack outStack = Inventory[OutputSlotId].Itemstack;
+		(string outType, string outCode) = GetTypeAndCode(outStack);
+		int outQty = outStack.StackSize;
+
+		// Capacity hint: fixed lines plus each ingredient line, sized from the codes it will contain
+		int capacity = 256 + outCode.Length;
+		foreach (IngredientInfo ing in ingBySymbol) capacity += 96 + ing.Code.Length;
+		var sb = new StringBuilder(capacity);
+		sb.AppendLine("{");
+
+		// Write ingredientPattern rows straight into the output buffer
+		sb.Append("\tingredientPattern: \"");
 		for (int ry = 0; ry < height; ry++)
 		{
-			var sbRow = new StringBuilder();
+			if (ry > 0) sb.Append(',');
 			for (int rx = 0; rx < width; rx++)
 			{
 				int x = minX + rx;
 				int y = minY + ry;
 				int slotIndex = y * GridCols + x;
 
-				if (symBySlot.TryGetValue(slotIndex, out char sym))	{ sbRow.Append(sym); }
-				else												{ sbRow.Append('_'); }
+				sb.Append(symBySlot[slotIndex]);
 			}
-
-			rows[ry] = sbRow.ToString();
 		}
-		string ingredientPattern = string.Join(",", rows);
-
-		// Output
-		ItemStack outStack = Inventory[OutputSlotId].Itemstack;
-		(string outType, string outCode) = GetTypeAndCode(outStack);
-		int outQty = outStack.StackSize;
-
-		var sb = new StringBuilder();
-		sb.AppendLine("{");
-		sb.AppendLine($"\tingredientPattern: \"{ingredientPattern}\",");
+		sb.AppendLine("\",");
 		sb.AppendLine("\tingredients: {");
 
-		foreach (var entry in ingBySymbol)
+		for (int i = 0; i < ingBySymbol.Count; i++)
 		{
-			char sym = entry.Key;
-			IngredientInfo ing = entry.Value;
+			char sym = Symbols[i];
+			IngredientInfo ing = ingBySymbol[i];
 
 			sb.Append($"\t\t\"{sym}\": {{ type: \"{ing.Type}\", code: \"{ing.Code}\"");
 			if (ing.Quantity != 1) sb.Append($", quantity: {ing.Quantity}");
@@ -270,11 +264,13 @@ public class GuiDialogCraftingDesigner : GuiDialogBlockEntity
 
 	private bool OnResetClicked()
 	{
-		// Reset tool durability inputs
+		// Reset tool durability inputs, only re-rendering the ones that actually changed
 		for (int i = 0; i < ToolDurabilityCosts.Length; i++)
 		{
 			ToolDurabilityCosts[i] = -1;
-			SingleComposer.GetTextInput($"toolcost{i}")?.SetValue("-1");
+
+			GuiElementTextInput input = SingleComposer.GetTextInput($"toolcost{i}");
+			if (input != null && input.GetText() != "-1") input.SetValue("-1");
 		}
 		capi.Network.SendBlockEntityPacket(BlockEntityPosition, PacketIdReset, null); // Ask server to clear the inventory
 